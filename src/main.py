@@ -29,39 +29,27 @@ import sys
 from pathlib import Path
 from datetime import datetime
 
-# Import the individual modules
-from validate_controls import validate_controls_file
-from evaluate_profile import (
-    evaluate_controls,
-    calculate_scores,
-    generate_json_report as generate_eval_json,
-    generate_markdown_report,
-    print_report,
-    REMEDIATION_GUIDANCE
-)
-from risk_tier import (
-    classify_risk_tier,
-    evaluate_high_risk_compliance,
-    print_classification_report,
-    generate_json_report as generate_risk_json
-)
-
-try:
-    import yaml
-except ImportError:
-    print("ERROR: PyYAML is required. Install with: pip install pyyaml")
-    sys.exit(1)
+# The tool modules (and PyYAML behind them) are imported lazily inside
+# each command handler, so `init` and `--help` don't pay their import cost.
 
 
 def load_controls(controls_path: Path):
-    """Load controls from YAML file."""
-    with open(controls_path) as f:
-        data = yaml.safe_load(f)
-    return data.get("controls", [])
+    """
+    Load controls from YAML file.
+
+    Delegates to evaluate_profile's cached loader, which keys a pickle
+    of the parsed list on the file's mtime and size - warm invocations
+    of every subcommand skip the YAML parse when the catalog is
+    unchanged.
+    """
+    from evaluate_profile import load_controls as _load_controls_cached
+    return _load_controls_cached(controls_path)
 
 
 def cmd_validate(args):
     """Validate the controls catalog."""
+    from validate_controls import validate_controls_file
+
     script_dir = Path(__file__).parent
     controls_path = args.controls or script_dir.parent / "controls" / "controls.yaml"
 
@@ -91,6 +79,17 @@ def cmd_validate(args):
 
 def cmd_evaluate(args):
     """Evaluate a system profile against controls."""
+    from evaluate_profile import (
+        evaluate_controls,
+        calculate_scores,
+        generate_json_report as generate_eval_json,
+        generate_markdown_report,
+        print_report,
+        precompile_controls,
+        load_json_file,
+        use_ascii_status,
+    )
+
     script_dir = Path(__file__).parent
     controls_path = args.controls or script_dir.parent / "controls" / "controls.yaml"
     profile_path = args.profile or script_dir / "sample_system_profile.json"
@@ -103,10 +102,11 @@ def cmd_evaluate(args):
         print(f"ERROR: Profile not found at {profile_path}")
         return 1
 
-    controls = load_controls(controls_path)
+    if args.ascii:
+        use_ascii_status()
 
-    with open(profile_path) as f:
-        profile = json.load(f)
+    controls = precompile_controls(load_controls(controls_path))
+    profile = load_json_file(profile_path)
 
     results = evaluate_controls(controls, profile, args.severity, args.failed_only)
     scores = calculate_scores(results)
@@ -132,6 +132,15 @@ def cmd_evaluate(args):
 
 def cmd_classify(args):
     """Classify system under EU AI Act risk tiers."""
+    from evaluate_profile import load_json_file
+    from risk_tier import (
+        Tier,
+        classify_risk_tier,
+        evaluate_high_risk_compliance,
+        print_classification_report,
+        generate_json_report as generate_risk_json,
+    )
+
     script_dir = Path(__file__).parent
     profile_path = args.profile or script_dir / "sample_system_profile.json"
 
@@ -139,22 +148,24 @@ def cmd_classify(args):
         print(f"ERROR: Profile not found at {profile_path}")
         return 1
 
-    with open(profile_path) as f:
-        profile = json.load(f)
+    profile = load_json_file(profile_path)
+
+    # Classify once; the reporters accept the result so they don't redo it
+    classification = classify_risk_tier(profile)
 
     if args.format == "json":
-        output = generate_risk_json(profile)
+        output = generate_risk_json(profile, classification=classification)
         print(output)
         if args.output:
             with open(args.output, "w") as f:
                 f.write(output)
     else:
-        print_classification_report(profile)
+        print_classification_report(profile, classification=classification)
 
-    tier, _, _ = classify_risk_tier(profile)
-    if tier == "unacceptable":
+    tier = classification[0]
+    if tier is Tier.UNACCEPTABLE:
         return 2
-    elif tier == "high":
+    elif tier is Tier.HIGH:
         compliance = evaluate_high_risk_compliance(profile)
         if compliance["compliance_rate"] < 100:
             return 1
@@ -287,6 +298,26 @@ def cmd_init(args):
 
 def cmd_report(args):
     """Generate a comprehensive compliance report."""
+    from evaluate_profile import (
+        evaluate_controls,
+        calculate_scores,
+        print_report,
+        precompile_controls,
+        load_json_file,
+        dumps_json,
+        use_ascii_status,
+    )
+    from risk_tier import (
+        Tier,
+        TIER_NAMES,
+        classify_risk_tier,
+        evaluate_high_risk_compliance,
+        print_classification_report,
+    )
+
+    if args.ascii:
+        use_ascii_status()
+
     script_dir = Path(__file__).parent
     controls_path = args.controls or script_dir.parent / "controls" / "controls.yaml"
     profile_path = args.profile or script_dir / "sample_system_profile.json"
@@ -299,10 +330,11 @@ def cmd_report(args):
         print(f"ERROR: Profile not found at {profile_path}")
         return 1
 
-    controls = load_controls(controls_path)
+    controls = precompile_controls(load_controls(controls_path))
+    profile = load_json_file(profile_path)
 
-    with open(profile_path) as f:
-        profile = json.load(f)
+    # One timestamp for everything this report emits
+    now = datetime.now()
 
     # Run evaluation
     results = evaluate_controls(controls, profile)
@@ -310,8 +342,9 @@ def cmd_report(args):
 
     # Run classification
     tier, reasons, obligations = classify_risk_tier(profile)
+    tier_name = TIER_NAMES[tier]
     high_risk_compliance = None
-    if tier == "high":
+    if tier is Tier.HIGH:
         high_risk_compliance = evaluate_high_risk_compliance(profile)
 
     # Build comprehensive report
@@ -319,58 +352,61 @@ def cmd_report(args):
         "metadata": {
             "system_name": profile.get("system_name", "Unknown"),
             "system_description": profile.get("system_description", ""),
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": now.isoformat(),
             "controls_version": "1.0"
         },
         "executive_summary": {
             "overall_pass_rate": scores["pass_rate"],
             "weighted_score": scores["weighted_score"],
-            "risk_tier": tier,
+            "risk_tier": tier_name,
             "high_severity_failures": scores["by_severity"].get("high", {}).get("failed", 0),
             "total_controls": scores["total"],
             "recommendation": _get_recommendation(scores, tier)
         },
         "control_evaluation": {
-            "summary": scores,
+            # Drop the underscore-prefixed working keys (e.g. the failed
+            # partition) that calculate_scores stashes for the printers
+            "summary": {k: v for k, v in scores.items() if not k.startswith("_")},
             "controls": [
                 {
-                    "id": r["id"],
-                    "title": r["title"],
-                    "severity": r["severity"],
-                    "passed": r["passed"],
-                    "evidence_path": r["evidence_path"],
-                    "nist_mapping": r["nist_mapping"],
-                    "eu_article": r["eu_article"]
+                    "id": r.id,
+                    "title": r.title,
+                    "severity": r.severity,
+                    "passed": r.passed,
+                    "evidence_path": r.evidence_path,
+                    "nist_mapping": r.nist_mapping,
+                    "eu_article": r.eu_article
                 }
                 for r in results
             ],
             "failed_controls": [
                 {
-                    "id": r["id"],
-                    "title": r["title"],
-                    "severity": r["severity"],
-                    "remediation_steps": r.get("remediation_steps", []),
-                    "required_artifacts": r.get("required_artifacts", [])
+                    "id": r.id,
+                    "title": r.title,
+                    "severity": r.severity,
+                    "remediation_steps": r.remediation_steps,
+                    "required_artifacts": r.required_artifacts
                 }
-                for r in results if not r["passed"]
+                for r in scores["_failed"]
             ]
         },
         "risk_classification": {
-            "tier": tier,
+            "tier": tier_name,
             "reasons": reasons,
             "obligations": obligations,
             "high_risk_compliance": high_risk_compliance
         }
     }
 
-    output = json.dumps(report, indent=2)
+    output = dumps_json(report)
 
     if args.format == "json" or args.output:
-        if not args.quiet:
-            print(output)
+        # Skip the stdout copy when it would just duplicate the saved file
+        # into a redirected (non-tty) stream
+        if not args.quiet and not (args.output and not sys.stdout.isatty()):
+            sys.stdout.write(output + "\n")
         if args.output:
-            with open(args.output, "w") as f:
-                f.write(output)
+            args.output.write_bytes(output.encode())
             print(f"\nFull report saved to: {args.output}")
     else:
         # Print summary
@@ -378,44 +414,50 @@ def cmd_report(args):
         print("COMPREHENSIVE AI GOVERNANCE COMPLIANCE REPORT")
         print("=" * 70)
         print(f"System: {profile.get('system_name', 'Unknown')}")
-        print(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}")
         print("=" * 70)
 
         print("\n## Executive Summary\n")
         print(f"- **Overall Pass Rate:** {scores['pass_rate']}%")
         print(f"- **Weighted Score:** {scores['weighted_score']}%")
-        print(f"- **EU AI Act Risk Tier:** {tier.upper()}")
+        print(f"- **EU AI Act Risk Tier:** {tier.name}")
         print(f"- **High-Severity Failures:** {scores['by_severity'].get('high', {}).get('failed', 0)}")
         print(f"\n**Recommendation:** {_get_recommendation(scores, tier)}")
 
         # Control summary
         print("\n## Control Evaluation\n")
-        print_report(results, scores, profile)
+        print_report(results, scores, profile, now=now)
 
-        # Risk classification
+        # Risk classification (already computed above - pass it through)
         print("\n")
-        print_classification_report(profile)
+        print_classification_report(
+            profile,
+            classification=(tier, reasons, obligations),
+            compliance=high_risk_compliance,
+        )
 
     # Determine exit code
     high_failures = scores["by_severity"].get("high", {}).get("failed", 0)
-    if tier == "unacceptable":
+    if tier is Tier.UNACCEPTABLE:
         return 2
     elif high_failures > 0:
         return 1
     return 0
 
 
-def _get_recommendation(scores: dict, tier: str) -> str:
-    """Generate a recommendation based on scores and tier."""
+def _get_recommendation(scores: dict, tier) -> str:
+    """Generate a recommendation based on scores and tier (a risk_tier.Tier)."""
+    from risk_tier import Tier
+
     high_failures = scores["by_severity"].get("high", {}).get("failed", 0)
 
-    if tier == "unacceptable":
+    if tier is Tier.UNACCEPTABLE:
         return "CRITICAL: System uses prohibited AI practices. Deployment not permitted under EU AI Act."
     elif high_failures > 0:
         return f"Address {high_failures} high-severity control failure(s) before production deployment."
     elif scores["pass_rate"] < 80:
         return "Improve control coverage to meet minimum compliance threshold of 80%."
-    elif tier == "high":
+    elif tier is Tier.HIGH:
         return "High-risk system - ensure ongoing compliance monitoring and annual reassessment."
     else:
         return "System meets baseline governance requirements. Continue periodic reviews."
@@ -458,6 +500,8 @@ Examples:
     p_evaluate.add_argument("-f", "--format", choices=["table", "markdown", "json"], default="table")
     p_evaluate.add_argument("--severity", choices=["low", "medium", "high", "critical"])
     p_evaluate.add_argument("--failed-only", action="store_true")
+    p_evaluate.add_argument("--ascii", action="store_true",
+                            help="Plain PASS/FAIL markers instead of emoji")
 
     # Classify command
     p_classify = subparsers.add_parser("classify", help="EU AI Act risk classification")
@@ -477,6 +521,8 @@ Examples:
     p_report.add_argument("-o", "--output", type=Path, help="Output file path")
     p_report.add_argument("-f", "--format", choices=["table", "json"], default="table")
     p_report.add_argument("-q", "--quiet", action="store_true")
+    p_report.add_argument("--ascii", action="store_true",
+                          help="Plain PASS/FAIL markers instead of emoji")
 
     args = parser.parse_args()
 
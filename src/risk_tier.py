@@ -23,12 +23,36 @@ Options:
     -q, --quiet           Minimal output
 """
 
-import argparse
+import functools
 import json
+import re
 import sys
+from enum import IntEnum
 from pathlib import Path
 from typing import Dict, Any, List, Tuple
-from datetime import datetime
+
+# argparse and datetime are imported lazily (parse_args / report
+# generation) so library consumers that only call classify_risk_tier
+# don't pay for them at import time
+
+try:
+    import orjson
+except ImportError:
+    # Optional accelerator; stdlib json is the fallback everywhere
+    orjson = None
+
+
+class Tier(IntEnum):
+    """EU AI Act risk tiers, ordered most to least restrictive."""
+    UNACCEPTABLE = 0
+    HIGH = 1
+    LIMITED = 2
+    MINIMAL = 3
+
+
+# Parallel tuples indexed by Tier ordinal - no per-report dict lookups
+TIER_NAMES = ("unacceptable", "high", "limited", "minimal")
+TIER_COLORS = ("🔴", "🟠", "🟡", "🟢")
 
 
 # Annex III high-risk categories (simplified)
@@ -43,112 +67,261 @@ ANNEX_III_CATEGORIES = {
     "justice": "Administration of justice and democratic processes"
 }
 
-# Keywords that suggest high-risk categories
+# Keywords that suggest high-risk categories (tuples: built once at
+# import, never mutated)
 HIGH_RISK_INDICATORS = {
-    "biometric": ["face", "facial", "fingerprint", "voice_id", "biometric", "identity"],
-    "critical_infrastructure": ["power", "water", "traffic", "energy", "grid", "scada"],
-    "education": ["student", "grading", "admission", "learning", "education"],
-    "employment": ["hiring", "recruitment", "employee", "hr", "performance_review", "termination"],
-    "essential_services": ["credit", "loan", "insurance", "benefits", "healthcare", "housing"],
-    "law_enforcement": ["police", "surveillance", "criminal", "enforcement", "security"],
-    "migration": ["visa", "border", "asylum", "immigration", "passport"],
-    "justice": ["court", "judge", "legal", "sentencing", "parole"]
+    "biometric": ("face", "facial", "fingerprint", "voice_id", "biometric", "identity"),
+    "critical_infrastructure": ("power", "water", "traffic", "energy", "grid", "scada"),
+    "education": ("student", "grading", "admission", "learning", "education"),
+    "employment": ("hiring", "recruitment", "employee", "hr", "performance_review", "termination"),
+    "essential_services": ("credit", "loan", "insurance", "benefits", "healthcare", "housing"),
+    "law_enforcement": ("police", "surveillance", "criminal", "enforcement", "security"),
+    "migration": ("visa", "border", "asylum", "immigration", "passport"),
+    "justice": ("court", "judge", "legal", "sentencing", "parole")
 }
 
 # Unacceptable use indicators
-UNACCEPTABLE_INDICATORS = [
+UNACCEPTABLE_INDICATORS = (
     "social_scoring",
     "subliminal",
     "exploitation_vulnerable",
     "real_time_biometric_public",
     "predictive_policing_individual"
-]
+)
 
 # Limited risk indicators (transparency obligations)
-LIMITED_RISK_INDICATORS = [
+LIMITED_RISK_INDICATORS = (
     "chatbot",
     "emotion_recognition",
     "deepfake",
     "synthetic_media",
     "content_generation"
-]
+)
+
+# Obligation lists are constant per tier - shared tuples, so
+# classification returns a reference instead of rebuilding them per call
+HIGH_RISK_OBLIGATIONS = (
+    "Art. 9: Risk management system required",
+    "Art. 10: Data governance requirements",
+    "Art. 11: Technical documentation required",
+    "Art. 12: Record-keeping obligations",
+    "Art. 13: Transparency requirements",
+    "Art. 14: Human oversight measures",
+    "Art. 15: Accuracy, robustness, cybersecurity",
+    "Art. 16: Provider quality management system",
+    "Art. 17: CE marking and EU declaration of conformity"
+)
+
+LIMITED_OBLIGATIONS = (
+    "Art. 50: Transparency obligations",
+    "Users must be informed they are interacting with AI",
+    "Synthetic content must be labeled"
+)
+
+try:
+    # Optional accelerator: one automaton pass over the profile text
+    # instead of a substring scan per keyword
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    # Optional accelerator for classify_batch's no-hit prefilter
+    import pandas
+except ImportError:
+    pandas = None
+
+# Every indicator keyword, deduplicated, in declaration order
+_ALL_INDICATORS = tuple(dict.fromkeys(
+    [kw for keywords in HIGH_RISK_INDICATORS.values() for kw in keywords]
+    + [*UNACCEPTABLE_INDICATORS, *LIMITED_RISK_INDICATORS]
+))
+
+if ahocorasick is not None:
+    _AUTOMATON = ahocorasick.Automaton()
+    for _kw in _ALL_INDICATORS:
+        _AUTOMATON.add_word(_kw, _kw)
+    _AUTOMATON.make_automaton()
+else:
+    _AUTOMATON = None
+
+# Compiled alternation over every keyword, longest first so overlapping
+# keywords ("facial"/"face") resolve to the longer match - they only
+# ever share a category, so classification is unaffected
+_INDICATOR_RE = re.compile("|".join(
+    re.escape(kw) for kw in sorted(_ALL_INDICATORS, key=len, reverse=True)
+))
+
+
+def _scan_indicators(text: str) -> set:
+    """
+    Return the set of indicator keywords occurring in text.
 
+    Uses the Aho-Corasick automaton (single linear pass) when
+    pyahocorasick is installed; otherwise one pass of the compiled
+    keyword alternation in the C regex engine. Both report substring
+    occurrences, so the classification result is the same either way.
+    """
+    if _AUTOMATON is not None:
+        return {kw for _, kw in _AUTOMATON.iter(text)}
+    return set(_INDICATOR_RE.findall(text))
+
+
+# Shared result for profiles with no indicator hits at all
+_MINIMAL_RESULT = (
+    Tier.MINIMAL,
+    ("No high-risk or limited-risk indicators detected",),
+    ("No specific EU AI Act obligations (general product safety applies)",)
+)
 
-def classify_risk_tier(profile: Dict[str, Any]) -> Tuple[str, List[str], List[str]]:
+
+@functools.lru_cache(maxsize=1024)
+def _classify(system_name: str, description: str, data_inventory: Tuple[str, ...]) -> Tuple[Tier, Tuple[str, ...], Tuple[str, ...]]:
     """
-    Classify system into EU AI Act risk tier.
-    
-    Returns:
-        - tier: "unacceptable", "high", "limited", or "minimal"
-        - reasons: List of reasons for classification
-        - obligations: List of applicable obligations
+    Classification core, memoized on the fields that drive the result.
+
+    Returns tuples only, so cached results are safe to share between
+    callers; classify_risk_tier converts back to lists at the boundary.
     """
     reasons = []
-    obligations = []
-    
-    # Get system info for classification
-    system_name = profile.get("system_name", "").lower()
-    description = profile.get("system_description", "").lower()
-    data_inventory = [d.lower() for d in profile.get("data_inventory", [])]
-    declared_tier = profile.get("risk_tier", "").lower()
-    
-    # Combine all text for keyword matching
-    all_text = f"{system_name} {description} {' '.join(data_inventory)}"
-    
+
+    # Prohibited-use pre-check on name+description alone: a hit returns
+    # before the data inventory is joined or scanned at all
+    raw = f"{system_name} {description}".lower()
+    for indicator in UNACCEPTABLE_INDICATORS:
+        if indicator in raw:
+            return (
+                Tier.UNACCEPTABLE,
+                (f"Detected prohibited use indicator: {indicator}",),
+                ("System deployment prohibited under EU AI Act Article 5",)
+            )
+
+    # Combine all text for keyword matching: one join, then one C-level
+    # downcase pass over the whole buffer (no per-field .lower() or
+    # intermediate lowered list)
+    all_text = " ".join([system_name, description, *data_inventory]).lower()
+
+    # One scan over the text; the checks below consult the hit set
+    hits = _scan_indicators(all_text)
+
     # Check for unacceptable uses
     for indicator in UNACCEPTABLE_INDICATORS:
-        if indicator in all_text:
+        if indicator in hits:
             return (
-                "unacceptable",
-                [f"Detected prohibited use indicator: {indicator}"],
-                ["System deployment prohibited under EU AI Act Article 5"]
+                Tier.UNACCEPTABLE,
+                (f"Detected prohibited use indicator: {indicator}",),
+                ("System deployment prohibited under EU AI Act Article 5",)
             )
-    
+
     # Check for high-risk indicators
     high_risk_matches = []
     for category, keywords in HIGH_RISK_INDICATORS.items():
         for keyword in keywords:
-            if keyword in all_text:
+            if keyword in hits:
                 high_risk_matches.append((category, keyword))
-    
+
     if high_risk_matches:
         categories = set(m[0] for m in high_risk_matches)
-        reasons = [
+        reasons = tuple(
             f"Matches Annex III category: {ANNEX_III_CATEGORIES.get(cat, cat)}"
             for cat in categories
-        ]
-        obligations = [
-            "Art. 9: Risk management system required",
-            "Art. 10: Data governance requirements",
-            "Art. 11: Technical documentation required",
-            "Art. 12: Record-keeping obligations",
-            "Art. 13: Transparency requirements",
-            "Art. 14: Human oversight measures",
-            "Art. 15: Accuracy, robustness, cybersecurity",
-            "Art. 16: Provider quality management system",
-            "Art. 17: CE marking and EU declaration of conformity"
-        ]
-        return ("high", reasons, obligations)
-    
+        )
+        return (Tier.HIGH, reasons, HIGH_RISK_OBLIGATIONS)
+
     # Check for limited risk indicators
     for indicator in LIMITED_RISK_INDICATORS:
-        if indicator in all_text:
+        if indicator in hits:
             reasons.append(f"Limited risk indicator: {indicator}")
-    
+
     if reasons:
-        obligations = [
-            "Art. 50: Transparency obligations",
-            "Users must be informed they are interacting with AI",
-            "Synthetic content must be labeled"
-        ]
-        return ("limited", reasons, obligations)
-    
+        return (Tier.LIMITED, tuple(reasons), LIMITED_OBLIGATIONS)
+
     # Default to minimal risk
-    return (
-        "minimal",
-        ["No high-risk or limited-risk indicators detected"],
-        ["No specific EU AI Act obligations (general product safety applies)"]
+    return _MINIMAL_RESULT
+
+
+def classify_risk_tier(profile: Dict[str, Any]) -> Tuple[Tier, List[str], List[str]]:
+    """
+    Classify system into EU AI Act risk tier.
+
+    Returns:
+        - tier: a Tier member (TIER_NAMES[tier] gives the lowercase name)
+        - reasons: List of reasons for classification
+        - obligations: List of applicable obligations
+
+    Repeated classification of the same profile (report + exit-code
+    paths, batch/server use) hits the lru_cache on _classify.
+    """
+    tier, reasons, obligations = _classify(
+        profile.get("system_name", ""),
+        profile.get("system_description", ""),
+        tuple(profile.get("data_inventory", ()))
     )
+    return tier, list(reasons), list(obligations)
+
+
+def classify_batch(profiles: List[Dict[str, Any]]) -> List[Tuple[Tier, List[str], List[str]]]:
+    """
+    Classify many profiles in one call.
+
+    With pandas installed, one vectorized regex sweep over all profile
+    texts finds the rows with no indicator hits - those are minimal by
+    definition and skip the classifier entirely. Remaining rows (and the
+    whole batch when pandas is absent) go through the memoized
+    classifier, so duplicate profiles are scanned once.
+    """
+    keys = [
+        (
+            p.get("system_name", ""),
+            p.get("system_description", ""),
+            tuple(p.get("data_inventory", ()))
+        )
+        for p in profiles
+    ]
+
+    if pandas is not None and len(keys) > 1:
+        texts = pandas.Series(
+            [" ".join([name, desc, *inv]).lower() for name, desc, inv in keys]
+        )
+        hit_mask = texts.str.contains(_INDICATOR_RE.pattern, regex=True)
+        results = [
+            _classify(*key) if hit else _MINIMAL_RESULT
+            for key, hit in zip(keys, hit_mask)
+        ]
+    else:
+        results = [_classify(*key) for key in keys]
+
+    return [
+        (tier, list(reasons), list(obligations))
+        for tier, reasons, obligations in results
+    ]
+
+
+# (check name, profile section, flag key) for the Annex III compliance
+# checks - static, so evaluate_high_risk_compliance is one loop
+_COMPLIANCE_CHECKS = (
+    ("risk_management_system", "ir_playbook", "exists"),
+    ("data_governance", "data_provenance", "documented"),
+    ("technical_documentation", "model_card", "exists"),
+    ("record_keeping", "logging", "enabled"),
+    ("transparency", "transparency", "user_informed_of_ai"),
+    ("human_oversight", "human_oversight", "exists"),
+    ("accuracy_testing", "fairness_eval", "conducted")
+)
+
+# Display names for the compliance checks, built once at import
+REQUIREMENT_NAMES = {
+    "risk_management_system": "Risk Management System (Art. 9)",
+    "data_governance": "Data Governance (Art. 10)",
+    "technical_documentation": "Technical Documentation (Art. 11)",
+    "record_keeping": "Record-Keeping (Art. 12)",
+    "transparency": "Transparency (Art. 13)",
+    "human_oversight": "Human Oversight (Art. 14)",
+    "accuracy_testing": "Accuracy/Fairness Testing (Art. 15)"
+}
+
+# Shared fallback for missing profile sections; never mutated
+_EMPTY: Dict[str, Any] = {}
 
 
 def evaluate_high_risk_compliance(profile: Dict[str, Any]) -> Dict[str, Any]:
@@ -156,15 +329,10 @@ def evaluate_high_risk_compliance(profile: Dict[str, Any]) -> Dict[str, Any]:
     For high-risk systems, evaluate compliance with Annex III requirements.
     """
     checks = {
-        "risk_management_system": bool(profile.get("ir_playbook", {}).get("exists")),
-        "data_governance": bool(profile.get("data_provenance", {}).get("documented")),
-        "technical_documentation": bool(profile.get("model_card", {}).get("exists")),
-        "record_keeping": bool(profile.get("logging", {}).get("enabled")),
-        "transparency": bool(profile.get("transparency", {}).get("user_informed_of_ai")),
-        "human_oversight": bool(profile.get("human_oversight", {}).get("exists")),
-        "accuracy_testing": bool(profile.get("fairness_eval", {}).get("conducted"))
+        name: bool(profile.get(section, _EMPTY).get(key))
+        for name, section, key in _COMPLIANCE_CHECKS
     }
-    
+
     passed = sum(1 for v in checks.values() if v)
     total = len(checks)
     
@@ -176,74 +344,81 @@ def evaluate_high_risk_compliance(profile: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def print_classification_report(profile: Dict[str, Any]):
-    """Print the risk tier classification report."""
-    
-    tier, reasons, obligations = classify_risk_tier(profile)
-    
-    tier_colors = {
-        "unacceptable": "🔴",
-        "high": "🟠",
-        "limited": "🟡",
-        "minimal": "🟢"
-    }
-    
-    print("=" * 70)
-    print("EU AI ACT RISK TIER CLASSIFICATION")
-    print("=" * 70)
-    print(f"System: {profile.get('system_name', 'Unknown')}")
-    print(f"Description: {profile.get('system_description', 'N/A')}")
-    print("=" * 70)
-    
-    print(f"\n## Classification Result\n")
-    print(f"**Risk Tier:** {tier_colors.get(tier, '⚪')} {tier.upper()}")
-    
-    print(f"\n### Classification Reasons\n")
+def print_classification_report(profile: Dict[str, Any], classification=None, compliance=None):
+    """
+    Print the risk tier classification report.
+
+    Callers that have already classified the profile (e.g. main.py's
+    report command) can pass the (tier, reasons, obligations) tuple and
+    the compliance dict to avoid re-walking the profile.
+    """
+
+    tier, reasons, obligations = classification or classify_risk_tier(profile)
+
+    # Build the whole report in memory and emit it with one write, rather
+    # than one syscall per print() line
+    out = []
+
+    out.append("=" * 70)
+    out.append("EU AI ACT RISK TIER CLASSIFICATION")
+    out.append("=" * 70)
+    out.append(f"System: {profile.get('system_name', 'Unknown')}")
+    out.append(f"Description: {profile.get('system_description', 'N/A')}")
+    out.append("=" * 70)
+
+    out.append(f"\n## Classification Result\n")
+    out.append(f"**Risk Tier:** {TIER_COLORS[tier]} {tier.name}")
+
+    out.append(f"\n### Classification Reasons\n")
     for reason in reasons:
-        print(f"- {reason}")
-    
-    print(f"\n### Applicable Obligations\n")
+        out.append(f"- {reason}")
+
+    out.append(f"\n### Applicable Obligations\n")
     for obligation in obligations:
-        print(f"- {obligation}")
-    
+        out.append(f"- {obligation}")
+
     # For high-risk systems, show compliance status
-    if tier == "high":
-        print("\n" + "=" * 70)
-        print("## HIGH-RISK COMPLIANCE CHECK")
-        print("=" * 70)
-        
-        compliance = evaluate_high_risk_compliance(profile)
-        
-        print(f"\n**Compliance Rate:** {compliance['compliance_rate']}%\n")
-        print("| Requirement | Status |")
-        print("|-------------|--------|")
-        
-        requirement_names = {
-            "risk_management_system": "Risk Management System (Art. 9)",
-            "data_governance": "Data Governance (Art. 10)",
-            "technical_documentation": "Technical Documentation (Art. 11)",
-            "record_keeping": "Record-Keeping (Art. 12)",
-            "transparency": "Transparency (Art. 13)",
-            "human_oversight": "Human Oversight (Art. 14)",
-            "accuracy_testing": "Accuracy/Fairness Testing (Art. 15)"
-        }
-        
-        for check, passed in compliance["checks"].items():
-            status = "✅" if passed else "❌"
-            name = requirement_names.get(check, check)
-            print(f"| {name} | {status} |")
-        
+    if tier is Tier.HIGH:
+        out.append("\n" + "=" * 70)
+        out.append("## HIGH-RISK COMPLIANCE CHECK")
+        out.append("=" * 70)
+
+        if compliance is None:
+            compliance = evaluate_high_risk_compliance(profile)
+
+        out.append(f"\n**Compliance Rate:** {compliance['compliance_rate']}%\n")
+        out.append("| Requirement | Status |")
+        out.append("|-------------|--------|")
+
+        out.append("\n".join(
+            f"| {REQUIREMENT_NAMES.get(check, check)} | {'✅' if passed else '❌'} |"
+            for check, passed in compliance["checks"].items()
+        ))
+
         # Gaps
         gaps = [k for k, v in compliance["checks"].items() if not v]
         if gaps:
-            print("\n### Compliance Gaps\n")
-            for gap in gaps:
-                print(f"- ❌ {requirement_names.get(gap, gap)}: Evidence missing or insufficient")
+            out.append("\n### Compliance Gaps\n")
+            out.append("\n".join(
+                f"- ❌ {REQUIREMENT_NAMES.get(gap, gap)}: Evidence missing or insufficient"
+                for gap in gaps
+            ))
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
-def generate_json_report(profile: Dict[str, Any]) -> str:
-    """Generate a JSON classification report."""
-    tier, reasons, obligations = classify_risk_tier(profile)
+def generate_json_report(profile: Dict[str, Any], classification=None, compliance=None, compact=False) -> str:
+    """
+    Generate a JSON classification report.
+
+    Precomputed classification/compliance results can be passed in to
+    avoid re-walking the profile. compact=True skips indentation - fewer
+    bytes and a faster dump when the consumer is a machine rather than a
+    person.
+    """
+    from datetime import datetime
+
+    tier, reasons, obligations = classification or classify_risk_tier(profile)
 
     report = {
         "metadata": {
@@ -252,22 +427,28 @@ def generate_json_report(profile: Dict[str, Any]) -> str:
             "classified_at": datetime.now().isoformat()
         },
         "classification": {
-            "risk_tier": tier,
+            "risk_tier": TIER_NAMES[tier],
             "reasons": reasons,
             "obligations": obligations
         }
     }
 
     # Add high-risk compliance if applicable
-    if tier == "high":
-        compliance = evaluate_high_risk_compliance(profile)
+    if tier is Tier.HIGH:
+        if compliance is None:
+            compliance = evaluate_high_risk_compliance(profile)
         report["high_risk_compliance"] = compliance
 
-    return json.dumps(report, indent=2)
+    if orjson is not None:
+        option = 0 if compact else orjson.OPT_INDENT_2
+        return orjson.dumps(report, option=option).decode()
+    return json.dumps(report, indent=None if compact else 2)
 
 
 def parse_args():
     """Parse command line arguments."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Classify AI systems under EU AI Act risk tiers",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -308,6 +489,11 @@ Examples:
         action="store_true",
         help="Minimal output"
     )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Emit JSON without indentation (for machine consumers)"
+    )
 
     return parser.parse_args()
 
@@ -326,39 +512,50 @@ def main():
         print(f"ERROR: Profile not found at {profile_path}")
         sys.exit(1)
 
-    with open(profile_path) as f:
-        profile = json.load(f)
+    # One contiguous bytes buffer for the parser - no incremental
+    # text-stream reads or separate decode step
+    data = profile_path.read_bytes()
+    profile = orjson.loads(data) if orjson is not None else json.loads(data)
+
+    # Classify and check compliance once; report and exit code reuse it
+    classification = classify_risk_tier(profile)
+    tier = classification[0]
+    compliance = evaluate_high_risk_compliance(profile) if tier is Tier.HIGH else None
 
     # Generate output
     if args.format == "json":
-        output = generate_json_report(profile)
+        output = generate_json_report(
+            profile, classification=classification, compliance=compliance,
+            compact=args.compact
+        )
         if not args.quiet:
             print(output)
     else:
+        output = None
         if not args.quiet:
-            print_classification_report(profile)
+            print_classification_report(
+                profile, classification=classification, compliance=compliance
+            )
 
     # Save to file if specified
     if args.output:
-        if args.format == "json":
-            content = generate_json_report(profile)
-        else:
-            # For table format, we save as JSON anyway
-            content = generate_json_report(profile)
-
-        with open(args.output, "w") as f:
-            f.write(content)
+        # For table format, we save as JSON anyway
+        if output is None:
+            output = generate_json_report(
+                profile, classification=classification, compliance=compliance,
+                compact=args.compact
+            )
+
+        # One binary write - no text-layer re-encode
+        args.output.write_bytes(output.encode())
         if not args.quiet:
             print(f"\nReport saved to: {args.output}")
 
     # Exit with code based on risk tier
-    tier, _, _ = classify_risk_tier(profile)
-    if tier == "unacceptable":
+    if tier is Tier.UNACCEPTABLE:
         sys.exit(2)  # Prohibited
-    elif tier == "high":
-        compliance = evaluate_high_risk_compliance(profile)
-        if compliance["compliance_rate"] < 100:
-            sys.exit(1)  # High-risk with gaps
+    elif tier is Tier.HIGH and compliance["compliance_rate"] < 100:
+        sys.exit(1)  # High-risk with gaps
 
     sys.exit(0)
 